@@ -9,12 +9,32 @@ Generates 5 packages:
 - AudioCloneServer (depends on AudioMessages)
 """
 
+import functools
+import hashlib
 import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List
-from jinja2 import Environment, FileSystemLoader, Template
+from grpc_tools import grpc_version, protoc
+from jinja2 import DictLoader, Environment, Template
+
+# KEY=value lines of a .env file; blank lines and '#' comments never match
+ENV_LINE_RE = re.compile(r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# Start of every line that is not blank, used to indent rendered method blocks
+INDENT_RE = re.compile(r'^(?=[ \t]*\S)', re.MULTILINE)
+
+# Proto file names use dashes, generated module names use underscores
+DASH_TO_UNDERSCORE = str.maketrans({"-": "_"})
+
+# Generated service pb2 modules import audio_message_pb2 as a top-level module
+AUDIO_MESSAGE_IMPORT_RE = re.compile(rb'^import audio_message_pb2 as audio__message__pb2', re.MULTILINE)
+AUDIO_MESSAGE_IMPORT = b'import audiomessages.audio_message_pb2 as audio__message__pb2'
 
 def load_env_file(env_file_path: str = None) -> None:
     """Load environment variables from a .env file."""
@@ -23,28 +43,50 @@ def load_env_file(env_file_path: str = None) -> None:
     
     env_path = Path(env_file_path)
     if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+        for key, value in ENV_LINE_RE.findall(env_path.read_text()):
+            os.environ[key] = value
 
 # Load environment variables from .env file
 load_env_file()
 
 # Configuration
 PROTO_DIR = Path(__file__).parent.parent / "proto"
+PROTO_DIR_STR = str(PROTO_DIR)
 OUTPUT_DIR = Path(os.environ.get("OUTPUT_DIR", str(Path(__file__).parent.parent / "generated_packages")))
 PACKAGES_DIR = OUTPUT_DIR / "packages"
+CACHE_DIR = OUTPUT_DIR / ".cache"
+STAGE_DIR = OUTPUT_DIR / ".protoc-stage"
+# Service packages depend on the generated audiomessages package by local path
+AUDIOMESSAGES_DEPENDENCY = f"audiomessages @ {(PACKAGES_DIR / 'audiomessages').as_uri()}"
 TEMPLATES_DIR = Path(__file__).parent / "templates"
+# Well-known types bundled with grpcio-tools (added by `python -m grpc_tools.protoc`)
+PROTOC_INCLUDE = Path(protoc.__file__).parent / "_proto"
+
+# Jinja2 template sources, read once so rendering never touches the filesystem
+TEMPLATE_SOURCES = {path.name: path.read_text() for path in TEMPLATES_DIR.glob("*.j2")}
+
+# Jinja2 template environment, shared by every package build
+TEMPLATE_ENV = Environment(
+    loader=DictLoader(TEMPLATE_SOURCES),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    auto_reload=False,
+    cache_size=-1
+)
+# Templates are compiled once at import instead of on every render
+TEMPLATES = {
+    name: TEMPLATE_ENV.get_template(name)
+    for name in TEMPLATE_SOURCES
+}
 
 # Package definitions
 PACKAGES = {
     "AudioMessages": {
         "proto_files": ["audio-message.proto"],
         "type": "messages",
-        "description": "Standalone package containing AudioMessage and Metadata protobuf messages"
+        "description": "Standalone package containing AudioMessage and Metadata protobuf messages",
+        "usage_example_template": "messages_usage_example.md.j2"
     },
     "TranscribeClient": {
         "proto_files": ["transcribe-interface.proto"],
@@ -54,7 +96,8 @@ PACKAGES = {
         "description": "Python client for TranscribeModelWorker service",
         "dependencies": ["AudioMessages"],
         "client_methods_template": "transcribe_client_methods.py.j2",
-        "client_example_template": "transcribe_client_example.py.j2"
+        "client_example_template": "transcribe_client_example.py.j2",
+        "usage_example_template": "client_usage_example.md.j2"
     },
     "TranscribeServer": {
         "proto_files": ["transcribe-interface.proto"],
@@ -65,7 +108,8 @@ PACKAGES = {
         "server_methods_template": "transcribe_server_methods.py.j2",
         "handler_example_template": "transcribe_handlers.py.j2",
         "handler_names": ["transcribe_handler", "stream_transcription_handler"],
-        "response_message": "TranscribeResponse"
+        "response_message": "TranscribeResponse",
+        "usage_example_template": "server_usage_example.md.j2"
     },
     "AudioCloneClient": {
         "proto_files": ["clone-interface.proto"],
@@ -75,7 +119,8 @@ PACKAGES = {
         "description": "Python client for AudioCloneModelWorker service",
         "dependencies": ["AudioMessages"],
         "client_methods_template": "clone_client_methods.py.j2",
-        "client_example_template": "clone_client_example.py.j2"
+        "client_example_template": "clone_client_example.py.j2",
+        "usage_example_template": "client_usage_example.md.j2"
     },
     "AudioCloneServer": {
         "proto_files": ["clone-interface.proto"],
@@ -86,124 +131,179 @@ PACKAGES = {
         "server_methods_template": "clone_server_methods.py.j2",
         "handler_example_template": "clone_handlers.py.j2",
         "handler_names": ["clone_handler", "stream_clone_handler"],
-        "response_message": "CloneResponse"
+        "response_message": "CloneResponse",
+        "usage_example_template": "server_usage_example.md.j2"
     }
 }
 
-def get_template_env() -> Environment:
-    """Initialize Jinja2 template environment."""
-    return Environment(
-        loader=FileSystemLoader(TEMPLATES_DIR),
-        trim_blocks=True,
-        lstrip_blocks=True,
-        keep_trailing_newline=True
-    )
+@functools.lru_cache(maxsize=None)
+def load_static_template(template_name: str) -> bytes:
+    """Read a template without Jinja2 placeholders as raw bytes."""
+    return (TEMPLATES_DIR / template_name).read_bytes()
+
+@functools.lru_cache(maxsize=None)
+def load_format_template(template_name: str) -> str:
+    """Read a .tmpl template that is filled in with str.format_map."""
+    return (TEMPLATES_DIR / template_name).read_text()
 
 def run_command(cmd: List[str], cwd: Path = None) -> bool:
     """Run a command and return success status."""
     print(f"Running: {' '.join(cmd)}")
     try:
-        result = subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True)
-        print(f"Success: {result.stdout}")
+        # Only stderr is needed (on failure), so stdout is not buffered
+        subprocess.run(cmd, cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        print("Success")
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error: {e.stderr}")
         return False
 
-def run_uv_command(cmd: List[str], cwd: Path = None) -> bool:
-    """Run a uv command and return success status."""
-    print(f"Running uv: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(["uv"] + cmd, cwd=cwd, check=True, capture_output=True, text=True)
-        print(f"Success: {result.stdout}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e.stderr}")
+def run_protoc(args: List[str]) -> bool:
+    """Run grpc_tools.protoc in-process and return success status."""
+    print(f"Running protoc: {' '.join(args)}")
+    if protoc.main(["grpc_tools.protoc"] + args + [f"-I{PROTOC_INCLUDE}"]) != 0:
+        print("Error: protoc failed")
         return False
+    return True
+
+def get_pb2_module_name(config: dict) -> str:
+    """Return the generated *_pb2 module name for the package's main proto file."""
+    return config["proto_files"][0].rsplit(".proto", 1)[0].translate(DASH_TO_UNDERSCORE) + "_pb2"
 
 def create_package_structure(package_name: str, config: dict) -> Path:
     """Create the package directory structure."""
-    package_dir = PACKAGES_DIR / package_name.lower()
+    module_name = package_name.lower()
+    package_dir = PACKAGES_DIR / module_name
     package_dir.mkdir(parents=True, exist_ok=True)
     
     # Create package structure
-    (package_dir / package_name.lower()).mkdir(exist_ok=True)
+    (package_dir / module_name).mkdir(exist_ok=True)
     (package_dir / "tests").mkdir(exist_ok=True)
     
     return package_dir
 
-def generate_proto_code(package_dir: Path, package_name: str, config: dict) -> bool:
-    """Generate Python code from proto files."""
-    module_name = package_name.lower()
-    proto_files = [str(PROTO_DIR / f) for f in config["proto_files"]]
+def proto_cache_key(config: dict) -> str:
+    """Compute the codegen cache key for a package's generated proto code."""
+    digest = hashlib.sha256()
+    # Hash every proto (not only config["proto_files"]) since imports affect the output
+    for proto_file in sorted(PROTO_DIR.glob("*.proto")):
+        digest.update(proto_file.name.encode())
+        digest.update(proto_file.read_bytes())
+    digest.update(" ".join(config["proto_files"]).encode())
+    digest.update(grpc_version.VERSION.encode())
+    digest.update(config["type"].encode())
+    # Post-processing below lives in this script, so changes to it invalidate the cache
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+def stage_proto_code(packages: dict) -> bool:
+    """Run protoc once over every proto needed by packages missing from the codegen cache."""
+    proto_names = sorted({
+        proto_file
+        for config in packages.values()
+        if not (CACHE_DIR / proto_cache_key(config)).is_dir()
+        for proto_file in config["proto_files"]
+    })
+    shutil.rmtree(STAGE_DIR, ignore_errors=True)
+    if not proto_names:
+        return True
+    
+    STAGE_DIR.mkdir(parents=True)
+    stage_out = str(STAGE_DIR)
     
     # Common grpc command for both messages and service packages
     grpc_cmd = [
-        "run", "python", "-m", "grpc_tools.protoc",
-        f"--proto_path={PROTO_DIR}",
-        f"--python_out={package_dir / module_name}",
-        f"--grpc_python_out={package_dir / module_name}",
-    ] + proto_files
+        f"--proto_path={PROTO_DIR_STR}",
+        f"--python_out={stage_out}",
+        f"--grpc_python_out={stage_out}",
+    ] + [f"{PROTO_DIR_STR}/{f}" for f in proto_names]
     
-    if not run_uv_command(grpc_cmd):
-        return False
-    
-    # Create __init__.py files
-    (package_dir / module_name / "__init__.py").touch()
-    
-    # Special cleanup for service packages (non-messages)
-    if config["type"] != "messages":
-        # Remove the generated audio_message_pb2.py files since they'll come from AudioMessages package
-        audio_message_pb2 = package_dir / module_name / "audio_message_pb2.py"
-        audio_message_pb2_grpc = package_dir / module_name / "audio_message_pb2_grpc.py"
-        
-        if audio_message_pb2.exists():
-            audio_message_pb2.unlink()
-        if audio_message_pb2_grpc.exists():
-            audio_message_pb2_grpc.unlink()
+    return run_protoc(grpc_cmd)
+
+def compile_proto_code(cache_dir: Path, config: dict, pb2_module_name: str) -> bool:
+    """Post-process staged protoc output in a scratch directory and publish it to the codegen cache."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Scratch lives on the cache's filesystem so publishing it is a single atomic rename
+    scratch_dir = Path(tempfile.mkdtemp(dir=CACHE_DIR))
+    try:
+        # Copy this package's modules out of the shared protoc stage
+        for proto_file in config["proto_files"]:
+            stem = proto_file.rsplit(".proto", 1)[0].translate(DASH_TO_UNDERSCORE)
+            for generated_name in (f"{stem}_pb2.py", f"{stem}_pb2_grpc.py"):
+                staged_file = STAGE_DIR / generated_name
+                if not staged_file.exists():
+                    print(f"Error: {staged_file} not found, run stage_proto_code first")
+                    return False
+                shutil.copy2(staged_file, scratch_dir / generated_name)
         
-        # Fix the imports in the generated pb2 files to use audiomessages package
-        for pb2_file in (package_dir / module_name).glob("*_pb2.py"):
-            content = pb2_file.read_text()
-            # Replace the import statement to use audiomessages package
-            content = content.replace(
-                'import audio_message_pb2 as audio__message__pb2',
-                'import audiomessages.audio_message_pb2 as audio__message__pb2'
-            )
-            pb2_file.write_text(content)
+        # Special cleanup for service packages (non-messages)
+        if config["type"] != "messages":
+            # Remove the generated audio_message_pb2.py files since they'll come from AudioMessages package
+            audio_message_pb2 = scratch_dir / "audio_message_pb2.py"
+            audio_message_pb2_grpc = scratch_dir / "audio_message_pb2_grpc.py"
             
-        # Fix imports in generated grpc files to be relative
-        for grpc_file in (package_dir / module_name).glob("*_pb2_grpc.py"):
-            content = grpc_file.read_text()
-            # Replace absolute import with relative import
-            # Pattern: import name_pb2 as name__pb2
-            base_name = config["proto_files"][0].replace('.proto', '')
-            import_name = base_name.replace('-', '_') + '_pb2'
+            if audio_message_pb2.exists():
+                audio_message_pb2.unlink()
+            if audio_message_pb2_grpc.exists():
+                audio_message_pb2_grpc.unlink()
             
-            content = content.replace(
-                f'import {import_name} as',
-                f'from . import {import_name} as'
-            )
-            grpc_file.write_text(content)
+            # Fix the imports in the generated pb2 files to use audiomessages package
+            for pb2_file in scratch_dir.glob("*_pb2.py"):
+                # Replace the import statement to use audiomessages package
+                content, replaced = AUDIO_MESSAGE_IMPORT_RE.subn(AUDIO_MESSAGE_IMPORT, pb2_file.read_bytes())
+                if replaced:
+                    pb2_file.write_bytes(content)
+                
+            # Fix imports in generated grpc files to be relative
+            for grpc_file in scratch_dir.glob("*_pb2_grpc.py"):
+                content = grpc_file.read_text()
+                # Replace absolute import with relative import
+                # Pattern: import name_pb2 as name__pb2
+                content = content.replace(
+                    f'import {pb2_module_name} as',
+                    f'from . import {pb2_module_name} as'
+                )
+                grpc_file.write_text(content)
+        
+        try:
+            scratch_dir.rename(cache_dir)
+        except OSError:
+            # Another build populated the same key first
+            pass
+        return True
+    finally:
+        if scratch_dir.exists():
+            shutil.rmtree(scratch_dir)
+
+def generate_proto_code(module_dir: Path, package_name: str, config: dict, pb2_module_name: str) -> bool:
+    """Generate Python code from proto files."""
+    # Reuse previously generated code when protos, protoc and package type are unchanged
+    cache_dir = CACHE_DIR / proto_cache_key(config)
+    if cache_dir.is_dir():
+        print(f"Using cached proto code for {package_name}")
+    elif not compile_proto_code(cache_dir, config, pb2_module_name):
+        return False
+    
+    for cached_file in cache_dir.iterdir():
+        shutil.copy2(cached_file, module_dir / cached_file.name)
+    
+    # Create __init__.py files
+    (module_dir / "__init__.py").touch()
     
     return True
 
-def create_client_wrapper(package_dir: Path, package_name: str, config: dict) -> bool:
+def create_client_wrapper(module_dir: Path, package_name: str, config: dict, pb2_module_name: str) -> bool:
     """Create client wrapper code using templates."""
-    env = get_template_env()
-    module_name = package_name.lower()
+    module_name = module_dir.name
     service_name = config["service"]
     
     # Load main client template
-    client_template = env.get_template("grpc_client_wrapper.py.j2")
-    
-    # Calculate pb2 module name from proto file
-    pb2_module_name = config["proto_files"][0].replace('.proto', '_pb2').replace('-', '_')
+    client_template = TEMPLATES["grpc_client_wrapper.py.j2"]
     
     # Load service-specific methods template
     template_name = config.get("client_methods_template")
     if template_name:
-        methods_template = env.get_template(template_name)
+        methods_template = TEMPLATES[template_name]
         service_methods = methods_template.render(
             service_name=service_name,
             pb2_module_name=pb2_module_name
@@ -213,7 +313,7 @@ def create_client_wrapper(package_dir: Path, package_name: str, config: dict) ->
     
     # Add proper indentation to service methods
     if service_methods:
-        indented_methods = "\n".join(f"    {line}" if line.strip() else line for line in service_methods.split("\n"))
+        indented_methods = INDENT_RE.sub("    ", service_methods)
     else:
         indented_methods = ""
     
@@ -228,13 +328,13 @@ def create_client_wrapper(package_dir: Path, package_name: str, config: dict) ->
         pb2_module_name=pb2_module_name
     )
     
-    client_file = package_dir / module_name / "client.py"
+    client_file = module_dir / "client.py"
     client_file.write_text(client_code)
     
     # Create client example if template is provided
     example_template_name = config.get("client_example_template")
     if example_template_name:
-        example_template = env.get_template(example_template_name)
+        example_template = TEMPLATES[example_template_name]
         example_code = example_template.render(
             description=config['description'],
             module_name=module_name,
@@ -242,19 +342,18 @@ def create_client_wrapper(package_dir: Path, package_name: str, config: dict) ->
             package_name=client_class_name,
             pb2_module_name=pb2_module_name
         )
-        example_file = package_dir / module_name / "client_example.py"
+        example_file = module_dir / "client_example.py"
         example_file.write_text(example_code)
     
     return True
 
-def create_server_skeleton(package_dir: Path, package_name: str, config: dict) -> bool:
+def create_server_skeleton(module_dir: Path, package_name: str, config: dict, pb2_module_name: str) -> bool:
     """Create server skeleton code using templates."""
-    env = get_template_env()
-    module_name = package_name.lower()
+    module_name = module_dir.name
     service_name = config["service"]
     
     # Load main server template
-    server_template = env.get_template("grpc_server_skeleton.py.j2")
+    server_template = TEMPLATES["grpc_server_skeleton.py.j2"]
     
     # Load service-specific methods template
     handlers_init_args = ""
@@ -265,8 +364,8 @@ def create_server_skeleton(package_dir: Path, package_name: str, config: dict) -
     handler_names = config.get("handler_names", [])
     
     if template_name and handler_names:
-        methods_template = env.get_template(template_name)
-        service_methods = methods_template.render(service_name=service_name, proto_file_name=config["proto_files"][0].replace('.proto', '_pb2').replace('-', '_'))
+        methods_template = TEMPLATES[template_name]
+        service_methods = methods_template.render(service_name=service_name, proto_file_name=pb2_module_name)
         
         # Define handlers dynamically
         args_list = [f"{name}: Callable" for name in handler_names]
@@ -277,7 +376,7 @@ def create_server_skeleton(package_dir: Path, package_name: str, config: dict) -
     
     # Add proper indentation to service methods
     if service_methods:
-        indented_methods = "\n".join(f"    {line}" if line.strip() else line for line in service_methods.split("\n"))
+        indented_methods = INDENT_RE.sub("    ", service_methods)
     else:
         indented_methods = ""
     
@@ -287,19 +386,18 @@ def create_server_skeleton(package_dir: Path, package_name: str, config: dict) -
         module_name=module_name,
         service_name=service_name,
         service_methods=indented_methods,
-        proto_file_name=config["proto_files"][0].replace('.proto', '_pb2').replace('-', '_'),
+        proto_file_name=pb2_module_name,
         handlers_init_args=handlers_init_args,
         handlers_init_assignments=handlers_init_assignments
     )
     
-    server_file = package_dir / module_name / "server.py"
+    server_file = module_dir / "server.py"
     server_file.write_text(server_code)
     
     return True
 
 def create_setup_py(package_dir: Path, package_name: str, config: dict) -> bool:
     """Create pyproject.toml for the package using templates."""
-    env = get_template_env()
     module_name = package_name.lower()
     
     # Base dependencies for all packages
@@ -315,10 +413,7 @@ def create_setup_py(package_dir: Path, package_name: str, config: dict) -> bool:
     
     # Add AudioMessages dependency for service packages as local path
     if config.get("dependencies"):
-        # Calculate absolute path to audiomessages package for proper dependency specification
-        audio_messages_path = PACKAGES_DIR / "audiomessages"
-        # Use local path format for dependency
-        base_dependencies.append(f"audiomessages @ {audio_messages_path.as_uri()}")
+        base_dependencies.append(AUDIOMESSAGES_DEPENDENCY)
     
     # Special handling for AudioMessages package - it doesn't need grpcio-tools
     if config["type"] == "messages":
@@ -326,39 +421,36 @@ def create_setup_py(package_dir: Path, package_name: str, config: dict) -> bool:
     else:
         dependencies = base_dependencies
     
-    # Load and render pyproject template
-    pyproject_template = env.get_template("python_package_config.toml.j2")
-    pyproject_content = pyproject_template.render(
-        description=config['description'],
-        package_name=package_name,
-        module_name=module_name,
-        dependencies=dependencies
-    )
+    # Fill in pyproject template (plain substitution, no Jinja2 needed)
+    pyproject_content = load_format_template("python_package_config.toml.tmpl").format_map({
+        "description": config['description'],
+        "package_name": package_name,
+        "module_name": module_name,
+        "dependencies": dependencies
+    })
     
     pyproject_file = package_dir / "pyproject.toml"
     pyproject_file.write_text(pyproject_content)
     
     return True
 
-def create_server_launcher(package_dir: Path, package_name: str, config: dict) -> bool:
+def create_server_launcher(module_dir: Path, package_name: str, config: dict, pb2_module_name: str) -> bool:
     """Create server launcher library using templates."""
-    env = get_template_env()
     
     # Load server launcher template
-    launcher_template = env.get_template("grpc_server_launcher.py.j2")
+    launcher_template = TEMPLATES["grpc_server_launcher.py.j2"]
     launcher_code = launcher_template.render(package_name=package_name)
     
     # Create launcher module
-    launcher_dir = package_dir / package_name.lower() / "grpc_server_launcher.py"
+    launcher_dir = module_dir / "grpc_server_launcher.py"
     launcher_dir.write_text(launcher_code)
     
     # Create server usage example with launcher
-    example_template = env.get_template("server_with_launcher_example.py.j2")
-    module_name = package_name.lower()
+    example_template = TEMPLATES["server_with_launcher_example.py.j2"]
+    module_name = module_dir.name
     service_name = config["service"]
     
-    pb2_module_name = config["proto_files"][0].replace('.proto', '_pb2').replace('-', '_')
-    grpc_module_name = config["proto_files"][0].replace('.proto', '_pb2_grpc').replace('-', '_')
+    grpc_module_name = f"{pb2_module_name}_grpc"
     
     handler_definitions = ""
     handler_kwargs_dict = ""
@@ -368,7 +460,7 @@ def create_server_launcher(package_dir: Path, package_name: str, config: dict) -
     handler_names = config.get("handler_names", [])
     
     if template_name and handler_names:
-        handler_template = env.get_template(template_name)
+        handler_template = TEMPLATES[template_name]
         handler_definitions = handler_template.render(pb2_module_name=pb2_module_name)
         
         kwargs_dict_list = [f"'{name}': {name}" for name in handler_names]
@@ -389,120 +481,121 @@ def create_server_launcher(package_dir: Path, package_name: str, config: dict) -
         handler_kwargs_args=handler_kwargs_args
     )
     
-    example_file = package_dir / package_name.lower() / "server_example.py"
+    example_file = module_dir / "server_example.py"
     example_file.write_text(example_code)
     
     # Create stop server script
-    stop_template = env.get_template("stop_server.py.j2")
+    stop_template = TEMPLATES["stop_server.py.j2"]
     stop_code = stop_template.render(
         service_name=service_name,
         package_name=package_name
     )
-    stop_file = package_dir / package_name.lower() / "stop_server.py"
+    stop_file = module_dir / "stop_server.py"
     stop_file.write_text(stop_code)
     
     return True
 
-def create_readme(package_dir: Path, package_name: str, config: dict) -> bool:
+def create_readme(package_dir: Path, package_name: str, config: dict, pb2_module_name: str) -> bool:
     """Create README.md for the package using templates."""
-    env = get_template_env()
     
-    # Load main README template
-    readme_template = env.get_template("package_readme.md.j2")
-    
-    # Load usage example template based on package type
-    if config["type"] == "messages":
-        usage_template = env.get_template("messages_usage_example.md.j2")
-        usage_examples = usage_template.render(package_name=package_name)
-    elif "Client" in package_name:
-        usage_template = env.get_template("client_usage_example.md.j2")
-        client_class_name = config.get("client_name", package_name)
-        module_name = package_name.lower()
-        usage_examples = usage_template.render(
-            module_name=module_name,
-            class_name=client_class_name
-        )
-    elif "Server" in package_name:
-        usage_template = env.get_template("server_usage_example.md.j2")
-        module_name = package_name.lower()
-        service_name = config["service"]
-        
-        pb2_module_name = config["proto_files"][0].replace('.proto', '_pb2').replace('-', '_')
-        grpc_module_name = config["proto_files"][0].replace('.proto', '_pb2_grpc').replace('-', '_')
-        
-        handler_keys = config.get("handler_names", [])
-        handler_init_kwargs_example = ",\n        ".join([f"'{k}': my_{k}" for k in handler_keys])
-        
-        response_message = config.get("response_message", f"{service_name}Response")
+    # Load usage example template declared by the package
+    usage_examples = ""
+    template_name = config.get("usage_example_template")
+    if template_name:
+        usage_template = TEMPLATES[template_name]
+        if config["type"] == "messages":
+            usage_examples = usage_template.render(package_name=package_name)
+        elif config["type"] == "client":
+            client_class_name = config.get("client_name", package_name)
+            module_name = package_name.lower()
+            usage_examples = usage_template.render(
+                module_name=module_name,
+                class_name=client_class_name
+            )
+        elif config["type"] == "server":
+            module_name = package_name.lower()
+            service_name = config["service"]
             
-        usage_examples = usage_template.render(
-            package_name=package_name,
-            module_name=module_name,
-            service_name=service_name,
-            pb2_module_name=pb2_module_name,
-            grpc_module_name=grpc_module_name,
-            handler_init_kwargs_example=handler_init_kwargs_example,
-            handler_keys=handler_keys,
-            response_message=response_message
-        )
-    else:
-        usage_examples = ""
+            grpc_module_name = f"{pb2_module_name}_grpc"
+            
+            handler_keys = config.get("handler_names", [])
+            handler_init_kwargs_example = ",\n        ".join([f"'{k}': my_{k}" for k in handler_keys])
+            
+            response_message = config.get("response_message", f"{service_name}Response")
+            
+            usage_examples = usage_template.render(
+                package_name=package_name,
+                module_name=module_name,
+                service_name=service_name,
+                pb2_module_name=pb2_module_name,
+                grpc_module_name=grpc_module_name,
+                handler_init_kwargs_example=handler_init_kwargs_example,
+                handler_keys=handler_keys,
+                response_message=response_message
+            )
     
-    # Render main README template
-    readme_content = readme_template.render(
-        package_name=package_name,
-        description=config['description'],
-        usage_examples=usage_examples
-    )
+    # Fill in main README template (plain substitution, no Jinja2 needed)
+    readme_content = load_format_template("package_readme.md.tmpl").format_map({
+        "package_name": package_name,
+        "module_name": package_name.lower(),
+        "description": config['description'],
+        "usage_examples": usage_examples
+    })
     
     readme_file = package_dir / "README.md"
     readme_file.write_text(readme_content)
     
     return True
 
+def create_messages_init(module_dir: Path, package_name: str, config: dict, pb2_module_name: str) -> bool:
+    """Create __init__.py for the AudioMessages package."""
+    # The messages init template has no placeholders, copy it verbatim
+    init_file = module_dir / "__init__.py"
+    init_file.write_bytes(load_static_template("messages_package_init.py.j2"))
+    
+    return True
+
+# Module code generators to run for each package type, in order
+TYPE_HANDLERS = {
+    "client": (create_client_wrapper,),
+    "server": (create_server_skeleton, create_server_launcher),
+    "messages": (create_messages_init,),
+}
+
 def build_package(package_name: str, config: dict) -> bool:
     """Build a single package."""
     print(f"\nBuilding package: {package_name}")
     
     # Create package structure
     package_dir = create_package_structure(package_name, config)
+    module_dir = package_dir / package_name.lower()
+    pb2_module_name = get_pb2_module_name(config)
     
     # Generate proto code
-    if not generate_proto_code(package_dir, package_name, config):
+    if not generate_proto_code(module_dir, package_name, config, pb2_module_name):
         return False
     
-    # Create wrapper code (only for client/server packages, not messages package)
-    if config["type"] == "client":
-        if not create_client_wrapper(package_dir, package_name, config):
+    # Create type-specific module code (wrapper/skeleton for services, __init__ for messages)
+    for create_module_code in TYPE_HANDLERS[config["type"]]:
+        if not create_module_code(module_dir, package_name, config, pb2_module_name):
             return False
-    elif config["type"] == "server":
-        if not create_server_skeleton(package_dir, package_name, config):
-            return False
-        if not create_server_launcher(package_dir, package_name, config):
-            return False
-    elif config["type"] == "messages":
-        # For AudioMessages package, create __init__.py using template
-        env = get_template_env()
-        module_name = package_name.lower()
-        
-        # Load and render messages init template
-        init_template = env.get_template("messages_package_init.py.j2")
-        init_content = init_template.render()
-        
-        init_file = package_dir / module_name / "__init__.py"
-        init_file.write_text(init_content)
     
     # Create pyproject.toml
     if not create_setup_py(package_dir, package_name, config):
         return False
     
     # Create README
-    if not create_readme(package_dir, package_name, config):
+    if not create_readme(package_dir, package_name, config, pb2_module_name):
         return False
     
     print(f"Successfully built {package_name}")
     return True
 
+def _build_one(item: tuple) -> bool:
+    """Build a (package_name, config) item; module-level so worker processes can pickle it."""
+    package_name, config = item
+    return build_package(package_name, config)
+
 def main():
     """Main build function."""
     print("Starting proto package build process...")
@@ -511,10 +604,25 @@ def main():
     OUTPUT_DIR.mkdir(exist_ok=True)
     PACKAGES_DIR.mkdir(exist_ok=True)
     
-    # Build all packages
+    # Parse and generate each proto once, packages then copy their modules from the stage
+    if not stage_proto_code(PACKAGES):
+        print("Failed to generate proto code")
+        sys.exit(1)
+    
+    # Build AudioMessages first, the service packages depend on it
+    messages_packages = {name: config for name, config in PACKAGES.items() if config["type"] == "messages"}
+    service_packages = {name: config for name, config in PACKAGES.items() if config["type"] != "messages"}
+    results = [_build_one(item) for item in messages_packages.items()]
+    
+    # Service packages are independent of each other, build them in parallel
+    with ProcessPoolExecutor(max_workers=len(service_packages)) as executor:
+        results += list(executor.map(_build_one, service_packages.items()))
+    
+    shutil.rmtree(STAGE_DIR, ignore_errors=True)
+    
     success_count = 0
-    for package_name, config in PACKAGES.items():
-        if build_package(package_name, config):
+    for package_name, success in zip(list(messages_packages) + list(service_packages), results):
+        if success:
             success_count += 1
         else:
             print(f"Failed to build {package_name}")
@@ -6,6 +6,7 @@ This script helps prepare the packages for publishing to git repositories.
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuration
@@ -19,51 +20,8 @@ PACKAGE_REPOS = {
     "audiocloneserver": "git@github.com:your-org/audio-clone-server.git"
 }
 
-def run_command(cmd, cwd=None):
-    """Run a command and return success status."""
-    print(f"Running: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True)
-        print(f"Success: {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e.stderr.strip()}")
-        return False
-
-def setup_git_repo(package_name: str, repo_url: str) -> bool:
-    """Initialize git repository for a package."""
-    package_dir = PACKAGES_DIR / package_name
-    
-    if not package_dir.exists():
-        print(f"Package directory {package_dir} does not exist")
-        return False
-    
-    print(f"\nSetting up git repo for {package_name}")
-    
-    # Initialize git repo
-    if not run_command(["git", "init"], cwd=package_dir):
-        return False
-    
-    # Add all files
-    if not run_command(["git", "add", "."], cwd=package_dir):
-        return False
-    
-    # Initial commit
-    if not run_command(["git", "commit", "-m", "Initial commit - generated from proto files"], cwd=package_dir):
-        return False
-    
-    # Add remote origin
-    if not run_command(["git", "remote", "add", "origin", repo_url], cwd=package_dir):
-        return False
-    
-    print(f"Git repository setup complete for {package_name}")
-    print(f"To push to remote: cd {package_dir} && git push -u origin main")
-    
-    return True
-
-def create_gitignore(package_dir: Path) -> bool:
-    """Create .gitignore file for the package."""
-    gitignore_content = """# Python
+# .gitignore written into every package repository
+GITIGNORE_CONTENT = b"""# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -104,26 +62,70 @@ ENV/
 .DS_Store
 Thumbs.db
 """
+
+def run_command(cmd, cwd=None):
+    """Run a command and return success status."""
+    print(f"Running: {' '.join(cmd)}")
+    try:
+        # Only stderr is needed (on failure), so stdout is not buffered
+        subprocess.run(cmd, cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        print("Success")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"Error: {e.stderr.strip()}")
+        return False
+
+def setup_git_repo(package_name: str, repo_url: str) -> bool:
+    """Initialize git repository for a package."""
+    package_dir = PACKAGES_DIR / package_name
+    
+    if not package_dir.exists():
+        print(f"Package directory {package_dir} does not exist")
+        return False
     
+    print(f"\nSetting up git repo for {package_name}")
+    
+    # Create .gitignore
+    create_gitignore(package_dir)
+    
+    # Initialize git repo
+    if not run_command(["git", "-C", str(package_dir), "init"]):
+        return False
+    
+    # Add all files
+    if not run_command(["git", "-C", str(package_dir), "add", "."]):
+        return False
+    
+    # Initial commit
+    if not run_command(["git", "-C", str(package_dir), "commit", "-m", "Initial commit - generated from proto files"]):
+        return False
+    
+    # Add remote origin
+    if not run_command(["git", "-C", str(package_dir), "remote", "add", "origin", repo_url]):
+        return False
+    
+    print(f"Git repository setup complete for {package_name}")
+    print(f"To push to remote: cd {package_dir} && git push -u origin main")
+    
+    return True
+
+def create_gitignore(package_dir: Path) -> bool:
+    """Create .gitignore file for the package."""
     gitignore_file = package_dir / ".gitignore"
-    gitignore_file.write_text(gitignore_content)
+    gitignore_file.write_bytes(GITIGNORE_CONTENT)
     return True
 
 def main():
     """Main setup function."""
     print("Setting up git repositories for generated packages...")
     
-    success_count = 0
+    # Each package is its own repository, so set them up concurrently
+    with ThreadPoolExecutor(max_workers=len(PACKAGE_REPOS)) as executor:
+        results = list(executor.map(setup_git_repo, PACKAGE_REPOS.keys(), PACKAGE_REPOS.values()))
     
-    for package_name, repo_url in PACKAGE_REPOS.items():
-        package_dir = PACKAGES_DIR / package_name
-        
-        # Create .gitignore
-        if package_dir.exists():
-            create_gitignore(package_dir)
-        
-        # Setup git repo
-        if setup_git_repo(package_name, repo_url):
+    success_count = 0
+    for package_name, success in zip(PACKAGE_REPOS, results):
+        if success:
             success_count += 1
         else:
             print(f"Failed to setup git repo for {package_name}")